@@ -0,0 +1,2 @@
+# This package contains the custom commands of the Scrapy project
+# (see the COMMANDS_MODULE setting).
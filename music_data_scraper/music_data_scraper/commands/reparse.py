@@ -0,0 +1,102 @@
+import os
+import multiprocessing as mp
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.exporters import JsonItemExporter
+from scrapy.http import HtmlResponse
+from itemadapter import is_item, ItemAdapter
+
+from music_data_scraper import pagecache
+from music_data_scraper.spiders.billboard import BillboardSpider
+
+
+# the spider of the worker process (created once per worker)
+_spider = None
+
+
+def _init_worker():
+    global _spider
+    _spider = BillboardSpider()
+
+
+def _parse_page(args):
+    cache_dir, date = args
+    
+    # rebuild the chart response from the cached page
+    url = "https://www.billboard.com/charts/hot-100/"\
+        + date.strftime('%Y-%m-%d')
+    body = pagecache.load_page(cache_dir, date)
+    response = HtmlResponse(url, body=body, encoding="utf-8")
+    
+    # parse the chart, dropping the requests for the following weeks
+    # (a broken page, e.g. a truncated one, should not stop the others)
+    _spider.resp_date = date
+    try:
+        items = [ItemAdapter(item).asdict() 
+            for item in _spider.parse(response) if is_item(item)]
+    except Exception as exc:
+        return date, [], f"{type(exc).__name__}: {exc}"
+    
+    return date, items, None
+
+
+class Command(ScrapyCommand):
+    
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+    
+    def syntax(self):
+        return "[options]"
+    
+    def short_desc(self):
+        return "Re-parse the cached Billboard chart pages (no network access)"
+    
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument("-o", "--output", metavar="FILE", 
+            default="billboard_data_reparsed.json", 
+            help="the output json file (overwritten)")
+        parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), 
+            help="the number of worker processes (default: all the cores)")
+        parser.add_argument("--cache-dir", metavar="DIR", 
+            help="the page cache catalogue (default: BILLBOARD_PAGE_CACHE_DIR)")
+    
+    def run(self, args, opts):
+        
+        cache_dir = opts.cache_dir or self.settings.get(
+            "BILLBOARD_PAGE_CACHE_DIR")
+        dates = pagecache.cached_dates(cache_dir)
+        if not dates:
+            raise UsageError(f"No cached chart pages in '{cache_dir}'")
+        
+        # parse the charts in parallel and export the items in the date order
+        # (into a temporary file first, so the previous output is kept 
+        # until the new one is complete)
+        failed = {}
+        with open(opts.output + ".tmp", "wb") as file, \
+                mp.Pool(opts.jobs, initializer=_init_worker) as pool:
+            exporter = JsonItemExporter(file, 
+                encoding=self.settings.get("FEED_EXPORT_ENCODING"), 
+                indent=self.settings.getint("FEED_EXPORT_INDENT"))
+            exporter.start_exporting()
+            
+            for date, items, error in pool.imap(_parse_page, 
+                    [(cache_dir, date) for date in dates], chunksize=16):
+                if error is not None:
+                    failed[date] = error
+                for item in items:
+                    exporter.export_item(item)
+            
+            exporter.finish_exporting()
+        os.replace(opts.output + ".tmp", opts.output)
+        
+        print(f"{len(dates) - len(failed)} charts re-parsed into "
+            f"'{opts.output}'")
+        
+        # report the pages which could not be parsed
+        if failed:
+            print(f"{len(failed)} cached pages failed to parse:")
+            for date, error in failed.items():
+                print(f"  {date}: {error}")
+            self.exitcode = 1
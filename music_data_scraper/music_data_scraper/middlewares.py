@@ -4,10 +4,13 @@
 # https://docs.scrapy.org/en/latest/topics/spider-middleware.html
 
 from scrapy import signals
+from scrapy.http import HtmlResponse
 
 # useful for handling different item types with a single interface
 from itemadapter import is_item, ItemAdapter
 
+from music_data_scraper import pagecache
+
 
 class MusicDataScraperSpiderMiddleware:
     # Not all methods need to be defined. If a method is not defined,
@@ -101,3 +104,41 @@ class MusicDataScraperDownloaderMiddleware:
 
     def spider_opened(self, spider):
         spider.logger.info("Spider opened: %s" % spider.name)
+
+
+class BillboardPageCacheMiddleware:
+    # Stores the fetched chart pages in a compressed local cache (keyed by
+    # the chart date) and serves the cached pages instead of downloading
+    # them again. The cache can be re-parsed offline with the
+    # `scrapy reparse` command. The middleware should be placed between the
+    # MetaRefreshMiddleware (580) and the HttpCompressionMiddleware (590),
+    # so the decompressed pages are stored.
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.settings.get("BILLBOARD_PAGE_CACHE_DIR"))
+
+    def process_request(self, request, spider):
+        date = pagecache.chart_date(request.url)
+        if date is None:
+            return None
+
+        body = pagecache.load_page(self.cache_dir, date)
+        if body is None:
+            return None
+
+        return HtmlResponse(request.url, body=body, encoding="utf-8",
+            request=request, flags=["cached"])
+
+    def process_response(self, request, response, spider):
+        date = pagecache.chart_date(request.url)
+        if date is None or response.status != 200 \
+                or "cached" in response.flags:
+            return response
+
+        pagecache.store_page(self.cache_dir, date, response.body)
+
+        return response
@@ -0,0 +1,89 @@
+"""A compressed local cache of the fetched Billboard chart pages."""
+
+import re, os, gzip
+import datetime as dt
+
+
+# the chart date pattern within the chart url
+CHART_URL_DATE = re.compile(r'/charts/hot-100/(\d{4}-\d{2}-\d{2})')
+
+
+def chart_date(url: str):
+    """
+    Grab the chart date from the Billboard chart url.
+
+    Parameters:
+        - url: The url of the chart page.
+
+    Returns:
+        A `datetime.date` object, or None if the url is not a chart page.
+    """
+
+    match = CHART_URL_DATE.search(url)
+    if match is None:
+        return None
+
+    return dt.date.fromisoformat(match.group(1))
+
+
+def page_path(cache_dir: str, date: dt.date):
+    """Return the path of the cached chart page for the given date."""
+
+    return os.path.join(cache_dir, date.strftime('%Y-%m-%d') + '.html.gz')
+
+
+def store_page(cache_dir: str, date: dt.date, body: bytes):
+    """
+    Store the chart page body in the cache (gzip compressed).
+
+    Parameters:
+        - cache_dir: The cache catalogue.
+        - date: The chart date (the cache key).
+        - body: The raw page body.
+
+    Returns:
+        The path of the cached page.
+    """
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = page_path(cache_dir, date)
+
+    # write into a temporary file first, so the interrupted crawl does not
+    # leave truncated pages in the cache
+    with gzip.open(path + '.tmp', 'wb') as file:
+        file.write(body)
+    os.replace(path + '.tmp', path)
+
+    return path
+
+
+def load_page(cache_dir: str, date: dt.date):
+    """
+    Load the chart page body from the cache.
+
+    Parameters:
+        - cache_dir: The cache catalogue.
+        - date: The chart date (the cache key).
+
+    Returns:
+        The raw page body (as bytes), or None if the page is not cached.
+    """
+
+    path = page_path(cache_dir, date)
+    if not os.path.exists(path):
+        return None
+
+    with gzip.open(path, 'rb') as file:
+        return file.read()
+
+
+def cached_dates(cache_dir: str):
+    """Return the sorted list of the chart dates stored in the cache."""
+
+    if not os.path.isdir(cache_dir):
+        return []
+
+    dates = [dt.date.fromisoformat(name.removesuffix('.html.gz'))
+        for name in os.listdir(cache_dir) if name.endswith('.html.gz')]
+
+    return sorted(dates)
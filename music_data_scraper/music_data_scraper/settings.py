@@ -51,9 +51,17 @@ ROBOTSTXT_OBEY = True
 
 # Enable or disable downloader middlewares
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
-#DOWNLOADER_MIDDLEWARES = {
+DOWNLOADER_MIDDLEWARES = {
 #    "music_data_scraper.middlewares.MusicDataScraperDownloaderMiddleware": 543,
-#}
+    "music_data_scraper.middlewares.BillboardPageCacheMiddleware": 585,
+}
+
+# The catalogue of the compressed chart pages (keyed by the chart date);
+# the cached pages can be re-parsed offline with `scrapy reparse`
+BILLBOARD_PAGE_CACHE_DIR = "billboard_pages"
+
+# Custom project commands (see the `commands` package)
+COMMANDS_MODULE = "music_data_scraper.commands"
 
 # Enable or disable extensions
 # See https://docs.scrapy.org/en/latest/topics/extensions.html
@@ -0,0 +1,280 @@
+"""Materialized aggregates of the Billboard charts (updated incrementally)."""
+
+import os, json
+
+import pandas as pd
+
+
+class ChartAggregates:
+    """
+    The materialized aggregate tables of the Billboard Hot 100 Ranking.
+    
+    The tables (with their key and value columns) are:
+        - `track_stats`: (artist, song) -> score, weeks, no_1, 
+        - `artist_stats`: (artist) -> score, 
+        - `yearly_tracks`: (year, artist, song) -> score, 
+        - `yearly_creators`: (year, artist) -> weeks.
+    
+    The state is kept in memory as dictionaries (the yearly tables are keyed
+    by the year first), so appending a new chart week (see the `add_week`
+    method) takes one update per chart position and table instead of
+    a full recomputation.
+    
+    On disk, the catalogue holds the snapshot of the tables (the
+    `snapshot.json` file) and the log of the weeks appended since then
+    (one `deltas/<date>.json` file per week). The appended week is stored
+    as its own small delta file, the deltas are replayed when the catalogue
+    is opened and merged into the snapshot by the `compact` method. Every
+    file is written into a temporary one first and then moved into place, 
+    so an interrupted write does not leave a partial state behind.
+    
+    Parameters:
+        - path: The catalogue of the stored tables; None by default
+          (in-memory only). The tables are loaded if the catalogue
+          contains the snapshot or the deltas.
+    """
+    
+    # the key and the value columns of the tables
+    TABLES = {
+        'track_stats': (['artist', 'song'], ['score', 'weeks', 'no_1']), 
+        'artist_stats': (['artist'], ['score']), 
+        'yearly_tracks': (['year', 'artist', 'song'], ['score']), 
+        'yearly_creators': (['year', 'artist'], ['weeks']), 
+    }
+    YEARLY = ('yearly_tracks', 'yearly_creators')
+    
+    def __init__(self, path: str | None = None):
+        
+        self.path = path
+        self.tables = {name: {} for name in self.TABLES}
+        self.dates = set()
+        
+        if path is not None:
+            self._load()
+    
+    def add_week(self, chart: pd.DataFrame):
+        """
+        Update the tables with a new weekly chart (and store the week as
+        a delta file, if the catalogue is set).
+        
+        Parameters:
+            - chart: The chart data frame (the Billboard data format, i.e., 
+              with the `date`, `pos`, `artist` and `song` columns)
+              of a single date.
+        
+        Returns:
+            A Boolean value; True if the tables were updated (raises
+            ValueError if the chart date has already been applied).
+        """
+        
+        dates = chart.date.unique()
+        if dates.size != 1:
+            raise ValueError('The chart should contain a single date, '
+                f'got {dates.size}')
+        date = pd.Timestamp(dates[0])
+        if date in self.dates:
+            raise ValueError(f'The chart of {date.date()} is already applied')
+        
+        # avoid overflows of the narrow integer types
+        rows = [(int(pos), artist, song)
+            for pos, artist, song in zip(chart.pos, chart.artist, chart.song)]
+        
+        # store the delta first, so the memory never runs ahead of the disk
+        if self.path is not None:
+            self._write(f'{self.path}/deltas/{date.date()}.json', 
+                {'date': str(date.date()), 'rows': rows})
+        
+        self._apply(date, rows)
+        
+        return True
+    
+    def _apply(self, date: pd.Timestamp, rows: list[tuple]):
+        
+        track_stats = self.tables['track_stats']
+        artist_stats = self.tables['artist_stats']
+        yearly_tracks = self.tables['yearly_tracks'].setdefault(date.year, {})
+        yearly_creators = self.tables['yearly_creators']\
+            .setdefault(date.year, {})
+        
+        # update the tables (one row per chart position)
+        for pos, artist, song in rows:
+            score = 101 - pos
+            
+            stats = track_stats.setdefault((artist, song), [0, 0, 0])
+            stats[0] += score
+            stats[1] += 1
+            stats[2] += int(pos == 1)
+            
+            artist_stats.setdefault((artist,), [0])[0] += score
+            yearly_tracks.setdefault((artist, song), [0])[0] += score
+            yearly_creators.setdefault((artist,), [0])[0] += 1
+        
+        self.dates.add(date)
+    
+    def _records(self, name: str):
+        # the flat table rows: keys followed by values
+        if name in self.YEARLY:
+            return [[year, *key, *value]
+                for year, rows in self.tables[name].items()
+                for key, value in rows.items()]
+        return [[*key, *value] for key, value in self.tables[name].items()]
+    
+    def _set_records(self, name: str, records: list):
+        no_keys = len(self.TABLES[name][0])
+        table = {}
+        for record in records:
+            key = tuple(record[:no_keys])
+            value = [int(x) for x in record[no_keys:]]
+            if name in self.YEARLY:
+                table.setdefault(int(key[0]), {})[key[1:]] = value
+            else:
+                table[key] = value
+        self.tables[name] = table
+    
+    def table(self, name: str):
+        """
+        Return the aggregate table as a pandas `DataFrame` object
+        (indexed by the table keys).
+        """
+        
+        keys, values = self.TABLES[name]
+        
+        return pd.DataFrame.from_records(self._records(name), 
+            columns=keys + values)\
+            .astype({value: 'int64' for value in values})\
+            .set_index(keys).sort_index()
+    
+    def yearly_top(self, year: int, n: int = 500):
+        """
+        Return the most popular tracks within the year (based on the
+        materialized yearly scores; ties at the last place are kept).
+        """
+        
+        rows = self.tables['yearly_tracks'].get(year, {})
+        
+        return pd.Series([value[0] for value in rows.values()], 
+            index=pd.MultiIndex.from_tuples(list(rows), 
+                names=['artist', 'song']), 
+            dtype='int64', name='yearly_score').nlargest(n, 'all').to_frame()
+    
+    def creators_per_year(self):
+        """Return the number of unique creators within each year."""
+        
+        return pd.Series({year: len(creators) for year, creators
+            in sorted(self.tables['yearly_creators'].items())}, 
+            dtype='int64').rename_axis('year')
+    
+    def compact(self):
+        """
+        Merge the appended weeks into the snapshot of the catalogue and
+        remove their delta files (raises ValueError if the catalogue
+        is not set).
+        """
+        
+        if self.path is None:
+            raise ValueError('The catalogue of the tables is not set')
+        
+        snapshot = {name: self._records(name) for name in self.TABLES}
+        snapshot['dates'] = [str(date.date()) for date in sorted(self.dates)]
+        self._write(f'{self.path}/snapshot.json', snapshot)
+        
+        # the deltas are already included in the snapshot
+        deltas = f'{self.path}/deltas'
+        if os.path.isdir(deltas):
+            for name in os.listdir(deltas):
+                if name.endswith('.json'):
+                    os.remove(f'{deltas}/{name}')
+        
+        return True
+    
+    def _write(self, path: str, obj: dict):
+        # write into a temporary file first and move it into place
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'w') as file:
+            json.dump(obj, file)
+        os.replace(path + '.tmp', path)
+    
+    def _load(self):
+        
+        # the snapshot
+        if os.path.exists(f'{self.path}/snapshot.json'):
+            with open(f'{self.path}/snapshot.json') as file:
+                snapshot = json.load(file)
+            for name in self.TABLES:
+                self._set_records(name, snapshot[name])
+            self.dates = set(pd.to_datetime(snapshot['dates']))
+        
+        # replay the weeks appended since the snapshot (the ones already
+        # merged are skipped, e.g., after an interrupted compaction)
+        deltas = f'{self.path}/deltas'
+        if os.path.isdir(deltas):
+            for name in sorted(os.listdir(deltas)):
+                if not name.endswith('.json'):
+                    continue
+                with open(f'{deltas}/{name}') as file:
+                    delta = json.load(file)
+                date = pd.Timestamp(delta['date'])
+                if date not in self.dates:
+                    self._apply(date, [tuple(row) for row in delta['rows']])
+
+    @classmethod
+    def from_charts(cls, hot_100: pd.DataFrame, path: str | None = None):
+        """
+        Build the tables from scratch (with the full recomputation).
+        
+        Parameters:
+            - hot_100: The Billboard data frame (with the `date`, `pos`, 
+              `artist` and `song` columns).
+            - path: The catalogue of the stored tables; None by default
+              (the tables are not saved). The snapshot in the catalogue
+              is replaced and the deltas are removed.
+        
+        Returns:
+            A `ChartAggregates` object.
+        """
+        
+        hot = hot_100.assign(score=lambda x: 101 - x.pos.astype('int64'), 
+            year=lambda x: x.date.dt.year.astype('int64'), 
+            no_1=lambda x: (x.pos == 1).astype('int64'))
+        
+        frames = {
+            'track_stats': hot.groupby(['artist', 'song'], observed=True)\
+                .agg(score=('score', 'sum'), weeks=('pos', 'size'), 
+                    no_1=('no_1', 'sum')), 
+            'artist_stats': hot.groupby(['artist'], observed=True)\
+                [['score']].sum(), 
+            'yearly_tracks': hot.groupby(['year', 'artist', 'song'], 
+                observed=True)[['score']].sum(), 
+            'yearly_creators': hot.groupby(['year', 'artist'], observed=True)\
+                .agg(weeks=('pos', 'size')), 
+        }
+        
+        aggs = cls()
+        aggs.path = path
+        for name, df in frames.items():
+            aggs._set_records(name, df.reset_index().itertuples(index=False))
+        aggs.dates = set(pd.DatetimeIndex(hot.date.unique()))
+        
+        if path is not None:
+            aggs.compact()
+        
+        return aggs
+    
+    def verify(self, hot_100: pd.DataFrame):
+        """
+        Check the tables against the full rebuild from scratch.
+        
+        Parameters:
+            - hot_100: The Billboard data frame with all the applied charts.
+        
+        Returns:
+            A Boolean value; True if all the tables match the rebuild
+            and False otherwise.
+        """
+        
+        rebuilt = self.from_charts(hot_100)
+        
+        return self.dates == rebuilt.dates and all(
+            self.table(name).equals(rebuilt.table(name))
+            for name in self.TABLES
+        )
@@ -0,0 +1,131 @@
+"""A precomputed index of the weekly Billboard charts."""
+
+import numpy as np
+import pandas as pd
+
+
+class ChartIndex:
+    """
+    The weekly snapshot index of the Billboard Hot 100 Ranking.
+    
+    The index is built once from the tracks data frame and consists of:
+        - the dense (week x position) matrix of the track IDs
+          (-1 for the missing positions), 
+        - the per-track lists of the (week, position) entries, sorted by week
+          (stored contiguously, with the offsets of each track).
+    
+    The point-in-time and range queries are answered without scanning the
+    whole data frame: the weeks are found by binary search and the tracks
+    by a hash lookup.
+    
+    Parameters:
+        - hot_tracks: The Billboard data frame indexed by the chart date, 
+          with the `pos` column and the track labels column.
+        - track_col: The name of the track labels column; 'track' by default.
+    
+    If a chart position is given more than once for the same date, the last
+    record is kept.
+    """
+    
+    def __init__(self, hot_tracks: pd.DataFrame, track_col: str = 'track'):
+        
+        hot_tracks = hot_tracks.sort_index(kind='stable')
+        
+        # the chart weeks and the week number of each record
+        dates = pd.DatetimeIndex(hot_tracks.index)
+        self.weeks = dates.unique()
+        week_i = self.weeks.get_indexer(dates).astype(np.int32)
+        pos = hot_tracks['pos'].to_numpy(dtype=np.int32)
+        
+        # drop the duplicated chart positions (keeping the last ones)
+        keep = ~pd.DataFrame({'week': week_i, 'pos': pos})\
+            .duplicated(keep='last').to_numpy()
+        week_i, pos = week_i[keep], pos[keep]
+        
+        # the track IDs (in the order of the first appearance)
+        track_ids, tracks = pd.factorize(
+            hot_tracks[track_col].to_numpy()[keep])
+        track_ids = track_ids.astype(np.int32)
+        self.tracks = pd.Index(tracks, name='track')
+        
+        # the dense (week x position) matrix
+        self.chart = np.full((self.weeks.size, pos.max(initial=0)), -1, 
+            dtype=np.int32)
+        self.chart[week_i, pos - 1] = track_ids
+        
+        # the per-track entries sorted by (track, week)
+        order = np.lexsort((week_i, track_ids))
+        self._entry_weeks = week_i[order]
+        self._entry_pos = pos[order]
+        self._offsets = np.zeros(self.tracks.size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(track_ids, minlength=self.tracks.size), 
+            out=self._offsets[1:])
+    
+    def chart_on(self, date):
+        """
+        Return the chart valid on the given date (the latest chart published
+        on or before the date, if the date falls within its week).
+        
+        Parameters:
+            - date: The date (anything accepted by `pd.Timestamp`).
+        
+        Returns:
+            A pandas `DataFrame` object indexed by the position, with
+            the `track` column (empty if the date precedes the first chart 
+            or falls after the week of the last one).
+        """
+        
+        date = pd.Timestamp(date)
+        week = self.weeks.searchsorted(date, side='right') - 1
+        
+        # no chart before the first week or after the last one
+        if week < 0 or date >= self.weeks[-1] + pd.Timedelta(weeks=1):
+            ids = np.array([], dtype=np.int32)
+        else:
+            ids = self.chart[week]
+        pos = np.flatnonzero(ids >= 0)
+        
+        return pd.DataFrame({'track': self.tracks[ids[pos]]}, 
+            index=pd.Index(pos + 1, name='pos', dtype=np.int64))
+    
+    def track_history(self, track: str):
+        """
+        Return the chart history of the given track.
+        
+        Parameters:
+            - track: The track label.
+        
+        Returns:
+            A pandas `DataFrame` object indexed by the chart date, with
+            the `pos` and the `track` columns (sorted by date).
+        """
+        
+        track_id = self.tracks.get_loc(track)
+        start, end = self._offsets[track_id], self._offsets[track_id + 1]
+        
+        return pd.DataFrame(
+            {'pos': self._entry_pos[start:end], 'track': track}, 
+            index=pd.DatetimeIndex(self.weeks[self._entry_weeks[start:end]], 
+                name='date')
+        )
+    
+    def tracks_in_range(self, start, end):
+        """
+        Return all the tracks present on the charts within the given dates
+        (inclusive on both sides).
+        
+        Parameters:
+            - start: The first date of the range.
+            - end: The last date of the range.
+        
+        Returns:
+            A pandas `Index` object with the track labels (in the order of
+            their first appearance on the charts).
+        """
+        
+        first = self.weeks.searchsorted(pd.Timestamp(start), side='left')
+        last = self.weeks.searchsorted(pd.Timestamp(end), side='right')
+        
+        ids = np.unique(self.chart[first:last])
+        
+        return self.tracks[ids[ids >= 0]]
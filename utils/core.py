@@ -0,0 +1,262 @@
+"""
+The core utility functions: labels matching, statistics and aggregations.
+
+The module imports only the standard library at load time; pandas and numpy 
+are imported within the functions using them (see the `utils` package).
+"""
+
+from __future__ import annotations
+
+import re, json, os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def labels_match(original_labels: list[str], compared_labels: list[str], 
+    match_thresh: float = 0.5):
+    """
+    A simple tool for matching the artist and the song labels.
+    
+    Parameters:
+        - original_labels: The list of the original labels: [artist, song].
+        - compared_labels: The list of the compared labels: [artist, song].
+        - match_thresh: The match threshold; 0.5 by default.
+    
+    Returns:
+        A Boolean value; True if the labels match and False otherwise.
+    """
+    
+    match_thresh = match_thresh - 1e-5
+    
+    # the labels
+    artist_0, song_0 = original_labels[0], original_labels[1]
+    artist_1, song_1 = compared_labels[0], compared_labels[1]
+    
+    # return False if the compared labels are null
+    if artist_1 == 'NaN' or song_1 == 'NaN':
+        return False
+    
+    # evaluate the artist labels:
+    # process the labels
+    artist_0 = re.sub(r'’', '\'', artist_0)
+    artist_0 = re.split(r', | | ', artist_0.lower())
+    artist_1 = re.sub(r'’', '\'', artist_1)
+    artist_1 = re.split(r', | | ', artist_1.lower())
+    # calculate the match coefficient (in both ways)
+    coef_a_01 = 0
+    for word in artist_0:
+        if word in artist_1:
+            coef_a_01 += 1
+    coef_a_10 = 0
+    for word in artist_1:
+        if word in artist_0:
+            coef_a_10 += 1
+    coef_a = max(coef_a_01 / len(artist_0), coef_a_10 / len(artist_1))
+    
+    # evaluate the song labels:
+    # process the labels
+    song_0 = re.sub(r'’', '\'', song_0)
+    song_0 = re.sub(r'!|\[|\]|\(|\)', '', song_0)
+    song_0 = re.split(r', | | ', song_0.lower())
+    song_1 = re.sub(r'’', '\'', song_1)
+    song_1 = re.sub(r'!|\[|\]|\(|\)', '', song_1)
+    song_1 = re.split(r', | | ', song_1.lower())
+    # calculate the match coefficient (in both ways)
+    coef_s_01 = 0
+    for word in song_0:
+        if word in song_1:
+            coef_s_01 += 1
+    coef_s_10 = 0
+    for word in song_1:
+        if word in song_0:
+            coef_s_10 += 1
+    coef_s = max(coef_s_01 / len(song_0), coef_s_10 / len(song_1))
+    
+    # compare the coefficients to the match threshold
+    if coef_a >= match_thresh and coef_s >= match_thresh:
+        return True
+    else:
+        return False
+
+
+def artist_stats(artist: str, hot_100: pd.DataFrame | None = None, 
+    out_dir: str = '.'):
+    """
+    Collect the artist's statistics (based on the Billboard Hot 100 Ranking).
+    
+    Parameters:
+        - artist: The name of the artist (as string).
+        - hot_100: The original data frame of the Billboard Hot 100 Ranking; 
+          None by default (if this case, the ranking is loaded from 
+          the `billboard_data.json` file).
+        - out_dir: The catalogue where the artist's catalogue is created; 
+          the current one by default.
+        
+    Returns:
+        The matplotlib `Figure` object with the score plot (also saved 
+        into the pdf file), so the plot is displayed in the notebook.
+    """
+    
+    import numpy as np
+    from utils.ingest import read_billboard
+    from utils.plotting import artist_score_plot
+    
+    # load the data if not provided
+    if hot_100 is None:
+        hot_100 = read_billboard()
+    
+    # grab the artist's songs (solo and in collaborations)
+    solo_df = hot_100.query(f'artist == "{artist}"')\
+        .assign(score=lambda x: 101 - x.pos)
+    colab_df = hot_100[
+        hot_100.artist.str.startswith(artist) & (hot_100.artist != artist)
+    ].assign(score=lambda x: 101 - x.pos)
+    
+    # collect the songs data (the labels can be categorical, hence only 
+    # the observed songs are grouped)
+    songs = {}
+    for df, songs_type in zip(
+        [solo_df, colab_df], ['solo_songs', 'collab_songs']
+    ):
+        song_dict = {}
+        for song, song_stats in df.groupby('song', sort=False, 
+                observed=True):
+            song_stats = song_stats.drop(columns=['song'])\
+                .astype({'date': 'str', 'last_week': 'float64'})
+            song_dict[song] = song_stats.to_dict('records')
+        songs[songs_type] = song_dict
+    
+    # collect the artist's basic statistics
+    report = [f'{artist} basic statistics']
+    
+    stat = solo_df.song.nunique()
+    report.append(f'\n\n\nNumber of solo songs: {stat}.')
+    
+    stat = colab_df.song.nunique()
+    report.append('\nNumber of songs in collaboration (as leading artist): '
+        f'{stat}.')
+    
+    stat = np.union1d(solo_df.date.values, colab_df.date.values).size
+    report.append(f'\n\nNumber of weeks on the Billboard Chart: {stat}.')
+    
+    stat = solo_df.score.sum()
+    report.append(f'\n\nThe total score based on solo songs only: {stat}.')
+    
+    stat = stat + colab_df.score.sum()
+    report.append('\nThe total score including collaborations '
+        f'(as leading artist): {stat}.')
+    
+    # the songs statistics (includes solo songs only!)
+    if solo_df.empty:
+        report.append('\n\nThe very first song on the Billboard List: none.')
+        report.append('\nThe very last song on the Billboard List: none.')
+        report.append('\n\nThe most successful solo song: none.')
+    else:
+        stat = solo_df.set_index('date').first('1D')\
+            .sort_values('pos').iloc[0]
+        report.append('\n\nThe very first song on the Billboard List: '
+            f'\'{stat.song}\' (on {stat.name.date()} ranking, '
+            f'pos: {stat.pos}).')
+        
+        stat = solo_df.set_index('date').last('1D')\
+            .sort_values('pos').iloc[0]
+        report.append('\nThe very last song on the Billboard List: '
+            f'\'{stat.song}\' (on {stat.name.date()} ranking, '
+            f'pos: {stat.pos}).')
+        
+        stat = solo_df.groupby('song', observed=True)\
+            .agg({'score': 'sum', 'wks_on_chart': 'max', 'peak_pos': 'min'})\
+            .sort_values('score', ascending=False).iloc[0]
+        report.append('\n\nThe most successful solo song: '
+            f'\'{stat.name}\' (score: {stat.score}, weeks on Chart: '
+            f'{stat.wks_on_chart}, peak position: {stat.peak_pos}).')
+    
+    if colab_df.empty:
+        report.append('\nThe most successful song in collaboration (as '
+            'leading artist): none.')
+    else:
+        stat = colab_df.groupby('song', observed=True)\
+            .agg({'artist': 'first', 'score': 'sum', 'wks_on_chart': 'max', 
+                'peak_pos': 'min'})\
+            .sort_values('score', ascending=False).iloc[0]
+        report.append('\nThe most successful song in collaboration (as '
+            f'leading artist): \'{stat.name}\' by \'{stat.artist}\' '
+            f'(score: {stat.score}, weeks on Chart: {stat.wks_on_chart}, '
+            f'peak position: {stat.peak_pos}).')
+    
+    # produce the score plot
+    fig = artist_score_plot(artist, solo_df, colab_df)
+    
+    # save all the files into the artist's catalogue (once everything has 
+    # been collected, so no half-written catalogue is left on errors)
+    artist_cat = artist.replace(' ', '_') + '_stats'
+    artist_path = os.path.join(out_dir, artist_cat)
+    os.makedirs(artist_path, exist_ok=True)
+    
+    for songs_type, song_dict in songs.items():
+        with open(f'{artist_path}/{songs_type}.json', 'w') as file:
+            json.dump(song_dict, file, indent=4)
+    
+    with open(f'{artist_path}/{artist_cat}.txt', 'w') as file:
+        file.write(''.join(report))
+    
+    fig.savefig(f'{artist_path}/{artist}_score.pdf')
+    
+    return fig
+
+
+def genres_popul(genres: list, genres_src: pd.Series, decades: bool = False):
+    """
+    Evaluate the popularity of chosen genres.
+    
+    Parameters:
+        - genres: The list of genres to examine 
+          (strings and/or lists of strings).
+        - genres_src: The source of genres data (as Series).
+        - decades: True for aggregating the results using decades; 
+          False by default (yearly schedule).
+    
+    Returns:
+        A pandas `DataFrame` object.
+    """
+    
+    import pandas as pd
+    import numpy as np
+    
+    # remove empty genres and set the aggregation frequency
+    genres_src = genres_src.loc[lambda x: x != '[]']
+    freq = 'Y' if not decades else '10Y'
+    
+    # count the songs within years/decades
+    if not decades:
+        songs_no = genres_src.groupby(level=0).count()
+    else:
+        genres_src = genres_src.loc[lambda x: (x.index >= '1960') 
+            & (x.index < '2020')]
+        songs_no = genres_src.groupby(pd.Grouper(freq='10Y')).count()
+    
+    # local function for evaluating genre popularity
+    def genre_popul(genre: str, /, freq: str):
+        return genres_src.apply(lambda x: bool(re.search(genre, x)))\
+            .groupby(pd.Grouper(freq=freq)).sum() / songs_no
+    
+    # evaluate popularities
+    genres_agg = pd.DataFrame()
+    
+    for genre in genres:
+        if isinstance(genre, str):
+            genre_ = genre.replace(' ', '_')
+            genres_agg[genre_] = genre_popul(genre, freq=freq)
+        if isinstance(genre, list):
+            genre_ = genre[0].replace(' ', '_')
+            genres_agg[genre_] = genre_popul(r'|'.join(genre), freq=freq)
+    
+    # improve the labels for the decades aggregation
+    if decades:
+        genres_agg.index = np.vectorize(lambda x: x + 's')\
+            (genres_agg.index.astype('str'))
+        genres_agg.index.name = 'decade'
+    
+    return genres_agg
@@ -0,0 +1,104 @@
+"""Parallel, chunked ingest of the Billboard scraper feed."""
+
+import io, os
+import multiprocessing as mp
+
+import numpy as np
+import pandas as pd
+
+
+# the schema of the `BillboardItem` fields (see the `items.py` and the
+# `itemloaders.py` files of the scraper); the last week position is missing
+# when the song enters the List for the very first time
+BILLBOARD_SCHEMA = {
+    'date': 'datetime64[ns]', 
+    'pos': 'int16', 
+    'artist': 'object', 
+    'song': 'object', 
+    'last_week': 'Int16', 
+    'peak_pos': 'int16', 
+    'wks_on_chart': 'int16', 
+}
+
+
+def _read_chunk(args: tuple):
+    path, start, end = args
+    
+    # grab the lines starting within the [start, end) byte range
+    lines = []
+    with open(path, 'rb') as file:
+        if start > 0:
+            file.seek(start - 1)
+            file.readline()  # the line started in the previous chunk
+        pos = file.tell()
+        while pos < end:
+            line = file.readline()
+            if not line:
+                break
+            pos += len(line)
+            
+            # skip the json array brackets and separators (the scrapy json
+            # feed has one item per line, as the json-lines feed does)
+            line = line.strip().rstrip(b',')
+            if line not in (b'', b'[', b']'):
+                lines.append(line)
+    
+    # parse the items and apply the schema
+    if lines:
+        chunk = pd.read_json(io.BytesIO(b'\n'.join(lines)), lines=True, 
+            dtype=False, convert_dates=False)
+    else:
+        chunk = pd.DataFrame(columns=list(BILLBOARD_SCHEMA))
+    
+    chunk = chunk[list(BILLBOARD_SCHEMA)].assign(
+        date=lambda x: pd.to_datetime(x.date, format='%Y-%m-%d')
+    ).astype(BILLBOARD_SCHEMA)
+    
+    # remove the duplicated chart positions within the chunk
+    return chunk.drop_duplicates(subset=['date', 'pos'])
+
+
+def read_billboard(path: str = 'music_data_scraper/billboard_data.json', 
+    processes: int | None = None, chunk_size: int = 2**22):
+    """
+    Load the Billboard scraper feed (json or json-lines, one item per line)
+    into a typed data frame.
+    
+    The feed is split into byte chunks parsed by a pool of worker processes, 
+    so only a few raw chunks are held in memory at once (instead of the whole
+    file and its generic objects). The duplicated chart positions, i.e., 
+    the records with the same (date, pos) key, are removed on the way
+    (the first record is kept).
+    
+    Parameters:
+        - path: The path of the feed file; the `billboard_data.json` file
+          by default.
+        - processes: The number of worker processes; None by default
+          (all the CPU cores).
+        - chunk_size: The size of the chunks (in bytes); 4 MB by default.
+    
+    Returns:
+        A pandas `DataFrame` object (see the `BILLBOARD_SCHEMA` for
+        the column types).
+    """
+    
+    size = os.path.getsize(path)
+    ranges = [(path, start, start + chunk_size)
+        for start in range(0, max(size, 1), chunk_size)]
+    
+    chunks = []
+    seen = set()  # the (date, pos) keys of the collected records
+    
+    with mp.Pool(processes) as pool:
+        for chunk in pool.imap(_read_chunk, ranges):
+            
+            # the (date, pos) keys packed into integers
+            keys = (chunk.date.values.astype('datetime64[D]')\
+                .astype('int64') << 8) | chunk.pos.values
+            
+            new = np.fromiter((key not in seen for key in keys.tolist()), 
+                dtype=bool, count=keys.size)
+            seen.update(keys[new].tolist())
+            chunks.append(chunk[new])
+    
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,52 @@
+"""
+Plotting utilities (matplotlib based).
+
+The plots are drawn on explicit `Figure` objects (not on the global pyplot 
+figure), so they can be produced safely from threads and worker processes.
+"""
+
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
+
+
+def artist_score_plot(artist: str, solo_df: pd.DataFrame, 
+    colab_df: pd.DataFrame):
+    """
+    Plot the artist's score evolution (solo and including collaborations).
+    
+    Parameters:
+        - artist: The name of the artist (as string).
+        - solo_df: The Billboard records of the artist's solo songs 
+          (with the `score` column).
+        - colab_df: The Billboard records of the artist's songs in 
+          collaboration (with the `score` column).
+    
+    Returns:
+        The matplotlib `Figure` object with the plot.
+    """
+    
+    # the cumulative scores
+    solo_score = solo_df.groupby('date').score.sum().cumsum()
+    total_score = pd.concat([solo_df, colab_df]).sort_values('date')\
+        .groupby('date').score.sum().cumsum()
+    
+    # produce the score plot
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    
+    ax.plot(solo_score.index, solo_score.values, lw=3)
+    ax.plot(total_score.index, total_score.values, lw=3)
+    
+    ax.set_xlabel('year')
+    ax.set_ylabel('score')
+    ax.tick_params(axis='x', labelrotation=0)
+    ax.yaxis.set_major_formatter(StrMethodFormatter('{x:,.0f}'))
+    ax.set_title(r'$\bf{' + f'{artist}' + r'}$ score evolution')
+    
+    ax.legend(reversed(ax.get_lines()), 
+        ['score including collaborations', 'solo score'])
+    
+    fig.tight_layout()
+    
+    return fig
@@ -0,0 +1,117 @@
+"""Parallel generation of the artists' statistics reports."""
+
+import tempfile
+import multiprocessing as mp
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from utils.core import artist_stats
+from utils.ingest import read_billboard
+
+
+# the Billboard data of the worker process
+_hot_100 = None
+
+
+def _share_columns(hot_100: pd.DataFrame, share_dir: str):
+    # store the columns as numpy files (the labels as categorical codes, 
+    # the nullable integers as the values and the mask) and return their
+    # specifications: (column, kind, categories)
+    specs = []
+    for col in hot_100.columns:
+        values = hot_100[col]
+        if values.dtype == 'object' \
+                or isinstance(values.dtype, pd.CategoricalDtype):
+            cat = pd.Categorical(values)
+            np.save(f'{share_dir}/{col}.npy', cat.codes)
+            specs.append((col, 'category', cat.categories))
+        elif pd.api.types.is_extension_array_dtype(values.dtype) \
+                and pd.api.types.is_integer_dtype(values.dtype):
+            np.save(f'{share_dir}/{col}.npy', 
+                values.to_numpy(dtype=values.dtype.numpy_dtype, na_value=0))
+            np.save(f'{share_dir}/{col}_mask.npy', values.isna().to_numpy())
+            specs.append((col, 'masked', None))
+        else:
+            np.save(f'{share_dir}/{col}.npy', values.to_numpy())
+            specs.append((col, 'numpy', None))
+    
+    return specs
+
+
+def _init_worker(share_dir: str, specs: list):
+    global _hot_100
+    
+    # rebuild the data frame from the memory-mapped columns (as views)
+    columns = {}
+    for col, kind, categories in specs:
+        values = np.load(f'{share_dir}/{col}.npy', mmap_mode='r')
+        if kind == 'category':
+            columns[col] = pd.Categorical.from_codes(values, 
+                dtype=pd.CategoricalDtype(categories))
+        elif kind == 'masked':
+            columns[col] = pd.arrays.IntegerArray(values, 
+                np.load(f'{share_dir}/{col}_mask.npy', mmap_mode='r'))
+        else:
+            columns[col] = values
+    _hot_100 = pd.DataFrame(columns, copy=False)
+    
+    matplotlib.use('agg')  # non-interactive backend
+
+
+def _artist_report(args: tuple):
+    artist, out_dir = args
+    
+    # a failed report should not stop the whole batch
+    try:
+        artist_stats(artist, _hot_100, out_dir)
+    except Exception as exc:
+        return artist, f'{type(exc).__name__}: {exc}'
+    
+    return artist, True
+
+
+def artist_reports(artists: list[str], hot_100: pd.DataFrame | None = None, 
+    processes: int | None = None, out_dir: str = '.'):
+    """
+    Collect the statistics of many artists in parallel (see the
+    `artist_stats` function for the contents of the reports).
+    
+    The reports are produced by a pool of worker processes (started with
+    the platform's default method). The Billboard data is shared with
+    the workers without copying: its columns are stored once in temporary
+    numpy files (the artist and song labels as categorical codes) and
+    memory-mapped by every worker, so the workers read the same pages of
+    the system cache. Only the lists of the unique labels are sent to
+    (and kept by) each worker.
+    
+    Parameters:
+        - artists: The list of the artists' names.
+        - hot_100: The original data frame of the Billboard Hot 100 Ranking;
+          None by default (if this case, the ranking is loaded from
+          the `billboard_data.json` file).
+        - processes: The number of worker processes; None by default
+          (all the CPU cores).
+        - out_dir: The catalogue where the artists' catalogues are created;
+          the current one by default.
+    
+    Returns:
+        A dictionary keyed by the artists' names; True if the artist's
+        report was produced, or the error message (as string) if it failed
+        (no catalogue is created in this case).
+    """
+    
+    # load the data once (for all the workers) if not provided
+    if hot_100 is None:
+        hot_100 = read_billboard()
+    
+    with tempfile.TemporaryDirectory() as share_dir:
+        specs = _share_columns(hot_100, share_dir)
+        
+        with mp.Pool(processes, initializer=_init_worker, 
+                initargs=(share_dir, specs)) as pool:
+            reports = dict(pool.imap_unordered(_artist_report, 
+                [(artist, out_dir) for artist in artists]))
+    
+    return {artist: reports[artist] for artist in artists}
@@ -1,81 +1,13 @@
-"""Utility functions."""
+"""Spotify Web API data collection (with the notebook progress display)."""
 
-import re, json, os, time
+import time
 import datetime as dt
 from IPython import display
 
 import requests
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.ticker import StrMethodFormatter
 
-
-def labels_match(original_labels: list[str], compared_labels: list[str], 
-    match_thresh: float = 0.5):
-    """
-    A simple tool for matching the artist and the song labels.
-    
-    Parameters:
-        - original_labels: The list of the original labels: [artist, song].
-        - compared_labels: The list of the compared labels: [artist, song].
-        - match_thresh: The match threshold; 0.5 by default.
-    
-    Returns:
-        A Boolean value; True if the labels match and False otherwise.
-    """
-    
-    match_thresh = match_thresh - 1e-5
-    
-    # the labels
-    artist_0, song_0 = original_labels[0], original_labels[1]
-    artist_1, song_1 = compared_labels[0], compared_labels[1]
-    
-    # return False if the compared labels are null
-    if artist_1 == 'NaN' or song_1 == 'NaN':
-        return False
-    
-    # evaluate the artist labels:
-    # process the labels
-    artist_0 = re.sub(r'’', '\'', artist_0)
-    artist_0 = re.split(r', | | ', artist_0.lower())
-    artist_1 = re.sub(r'’', '\'', artist_1)
-    artist_1 = re.split(r', | | ', artist_1.lower())
-    # calculate the match coefficient (in both ways)
-    coef_a_01 = 0
-    for word in artist_0:
-        if word in artist_1:
-            coef_a_01 += 1
-    coef_a_10 = 0
-    for word in artist_1:
-        if word in artist_0:
-            coef_a_10 += 1
-    coef_a = max(coef_a_01 / len(artist_0), coef_a_10 / len(artist_1))
-    
-    # evaluate the song labels:
-    # process the labels
-    song_0 = re.sub(r'’', '\'', song_0)
-    song_0 = re.sub(r'!|\[|\]|\(|\)', '', song_0)
-    song_0 = re.split(r', | | ', song_0.lower())
-    song_1 = re.sub(r'’', '\'', song_1)
-    song_1 = re.sub(r'!|\[|\]|\(|\)', '', song_1)
-    song_1 = re.split(r', | | ', song_1.lower())
-    # calculate the match coefficient (in both ways)
-    coef_s_01 = 0
-    for word in song_0:
-        if word in song_1:
-            coef_s_01 += 1
-    coef_s_10 = 0
-    for word in song_1:
-        if word in song_0:
-            coef_s_10 += 1
-    coef_s = max(coef_s_01 / len(song_0), coef_s_10 / len(song_1))
-    
-    # compare the coefficients to the match threshold
-    if coef_a >= match_thresh and coef_s >= match_thresh:
-        return True
-    else:
-        return False
+from utils.core import labels_match
 
 
 def spotify_audio_features(df: pd.DataFrame, 
@@ -315,169 +247,3 @@ def spotify_audio_features(df: pd.DataFrame,
     display.display('All the batches collected!')
     
     return True
-
-
-def artist_stats(artist: str, hot_100: pd.DataFrame | None = None):
-    """
-    Collect the artist's statistics (based on the Billboard Hot 100 Ranking).
-    
-    Parameters:
-        - artist: The name of the artist (as string).
-        - hot_100: The original data frame of the Billboard Hot 100 Ranking; 
-          None by default (if this case, the ranking is loaded from 
-          the `billboard_data.json` file).
-        
-    Returns:
-        A Boolean value if all the statistics were collected.
-    """
-    
-    # load the data if not provided
-    if hot_100 is None:
-        hot_100 = pd.read_json('music_data_scraper/billboard_data.json')\
-            .drop_duplicates()
-    
-    # prepare the artist's catalogue
-    artist_cat = artist.replace(' ', '_') + '_stats'
-    os.system(f'mkdir {artist_cat}')
-    
-    # grab the artist's songs (solo and in collaborations)
-    solo_df = hot_100.query(f'artist == "{artist}"')\
-        .assign(score=lambda x: 101 - x.pos)
-    colab_df = hot_100[
-        hot_100.artist.str.startswith(artist) & (hot_100.artist != artist)
-    ].assign(score=lambda x: 101 - x.pos)
-    
-    # save the songs data into json files
-    for df, songs_type in zip(
-        [solo_df, colab_df], ['solo_songs', 'collab_songs']
-    ):
-        song_dict = {}
-        for song, song_stats in df.groupby('song', sort=False):
-            song_stats = song_stats.drop(columns=['song'])\
-                .astype({'date': 'str'})
-            song_dict[song] = song_stats.to_dict('records')
-        
-        with open(f'{artist_cat}/{songs_type}.json', 'w') as file:
-            json.dump(song_dict, file, indent=4)
-    
-    # save the artist's basic statistics
-    with open(f'{artist_cat}/{artist_cat}.txt', 'w') as file:
-        file.write(f'{artist} basic statistics')
-        
-        stat = solo_df.song.nunique()
-        file.write(f'\n\n\nNumber of solo songs: {stat}.')
-        
-        stat = colab_df.song.nunique()
-        file.write('\nNumber of songs in collaboration (as leading artist): '
-            f'{stat}.')
-        
-        stat = np.union1d(solo_df.date.values, colab_df.date.values).size
-        file.write(f'\n\nNumber of weeks on the Billboard Chart: {stat}.')
-        
-        stat = solo_df.score.sum()
-        file.write(f'\n\nThe total score based on solo songs only: {stat}.')
-        
-        stat = stat + colab_df.score.sum()
-        file.write('\nThe total score including collaborations '
-            f'(as leading artist): {stat}.')
-        
-        stat = solo_df.set_index('date').first('1D').sort_values('pos').iloc[0]
-        file.write('\n\nThe very first song on the Billboard List: '
-            f'\'{stat.song}\' (on {stat.name.date()} ranking, '
-            f'pos: {stat.pos}).')  # includes solo songs only!
-        
-        stat = solo_df.set_index('date').last('1D').sort_values('pos').iloc[0]
-        file.write('\nThe very last song on the Billboard List: '
-            f'\'{stat.song}\' (on {stat.name.date()} ranking, '
-            f'pos: {stat.pos}).')  # includes solo songs only!
-        
-        stat = solo_df.groupby('song')\
-            .agg({'score': 'sum', 'wks_on_chart': 'max', 'peak_pos': 'min'})\
-            .sort_values('score', ascending=False).iloc[0]
-        file.write('\n\nThe most successful solo song: '
-            f'\'{stat.name}\' (score: {stat.score}, weeks on Chart: '
-            f'{stat.wks_on_chart}, peak position: {stat.peak_pos}).')
-    
-        stat = colab_df.groupby('song')\
-            .agg({'artist': 'first', 'score': 'sum', 'wks_on_chart': 'max', 
-                'peak_pos': 'min'})\
-            .sort_values('score', ascending=False).iloc[0]
-        file.write('\nThe most successful song in collaboration (as leading '
-            f'artist): \'{stat.name}\' by \'{stat.artist}\' '
-            f'(score: {stat.score}, weeks on Chart: {stat.wks_on_chart}, '
-            f'peak position: {stat.peak_pos}).')
-    
-    # produce the score plot
-    ax = solo_df.groupby('date').score.sum().cumsum()\
-        .plot(lw=3, figsize=(10, 5))
-        
-    pd.concat([solo_df, colab_df]).sort_values('date')\
-        .groupby('date').score.sum().cumsum()\
-        .plot(xlabel='year', ylabel='score', lw=3, ax=ax)
-    
-    plt.xticks(rotation=0, ha='center')
-    ax.yaxis.set_major_formatter(StrMethodFormatter('{x:,.0f}'))
-    plt.title(r'$\bf{' + f'{artist}' + r'}$ score evolution')
-    
-    handles, _ = ax.get_legend_handles_labels()
-    plt.legend(reversed(handles), 
-        ['score including collaborations', 'solo score'])
-    
-    plt.tight_layout()
-    
-    # save the plot to a pdf file
-    plt.gcf().savefig(f'{artist_cat}/{artist}_score.pdf')
-    
-    return True
-
-
-def genres_popul(genres: list, genres_src: pd.Series, decades: bool = False):
-    """
-    Evaluate the popularity of chosen genres.
-    
-    Parameters:
-        - genres: The list of genres to examine 
-          (strings and/or lists of strings).
-        - genres_src: The source of genres data (as Series).
-        - decades: True for aggregating the results using decades; 
-          False by default (yearly schedule).
-    
-    Returns:
-        A pandas `DataFrame` object.
-    """
-    
-    # remove empty genres and set the aggregation frequency
-    genres_src = genres_src.loc[lambda x: x != '[]']
-    freq = 'Y' if not decades else '10Y'
-    
-    # count the songs within years/decades
-    if not decades:
-        songs_no = genres_src.groupby(level=0).count()
-    else:
-        genres_src = genres_src.loc[lambda x: (x.index >= '1960') 
-            & (x.index < '2020')]
-        songs_no = genres_src.groupby(pd.Grouper(freq='10Y')).count()
-    
-    # local function for evaluating genre popularity
-    def genre_popul(genre: str, /, freq: str):
-        return genres_src.apply(lambda x: bool(re.search(genre, x)))\
-            .groupby(pd.Grouper(freq=freq)).sum() / songs_no
-    
-    # evaluate popularities
-    genres_agg = pd.DataFrame()
-    
-    for genre in genres:
-        if isinstance(genre, str):
-            genre_ = genre.replace(' ', '_')
-            genres_agg[genre_] = genre_popul(genre, freq=freq)
-        if isinstance(genre, list):
-            genre_ = genre[0].replace(' ', '_')
-            genres_agg[genre_] = genre_popul(r'|'.join(genre), freq=freq)
-    
-    # improve the labels for the decades aggregation
-    if decades:
-        genres_agg.index = np.vectorize(lambda x: x + 's')\
-            (genres_agg.index.astype('str'))
-        genres_agg.index.name = 'decade'
-    
-    return genres_agg